@@ -1,9 +1,19 @@
 import sys, json, os, ctypes, time
+from collections import OrderedDict
 from ctypes import wintypes
 import ctypes.wintypes as wt
 from pathlib import Path
 from PySide6 import QtCore, QtGui, QtWidgets
 
+# orjson is optional; it serializes straight to bytes and is much faster
+try:
+    import orjson
+    _dumps = orjson.dumps
+    _loads = orjson.loads
+except ImportError:
+    _dumps = lambda d: json.dumps(d, separators=(",", ":")).encode("utf-8")
+    _loads = json.loads
+
 APP_NAME = "ActiveSticky"
 STATE_PATH = Path(os.getenv("APPDATA", ".")) / APP_NAME / "state.json"
 STATE_PATH.parent.mkdir(parents=True, exist_ok=True)
@@ -31,6 +41,9 @@ WS_EX_NOACTIVATE   = 0x08000000
 WM_HOTKEY = 0x0312
 WM_CLOSE  = 0x0010
 
+SYNCHRONIZE   = 0x00100000
+WAIT_TIMEOUT  = 0x00000102
+
 MOD_ALT = 0x0001
 MOD_CONTROL = 0x0002
 MOD_SHIFT = 0x0004
@@ -70,48 +83,65 @@ user32.RegisterHotKey.argtypes = [wintypes.HWND, wintypes.INT, wintypes.UINT, wi
 user32.UnregisterHotKey.restype = wintypes.BOOL
 user32.UnregisterHotKey.argtypes = [wintypes.HWND, wintypes.INT]
 
-# EnumWindows callback type (correct one)
-WNDENUMPROC = ctypes.WINFUNCTYPE(wintypes.BOOL, wintypes.HWND, wintypes.LPARAM)
-user32.EnumWindows.restype = wintypes.BOOL
-user32.EnumWindows.argtypes = [WNDENUMPROC, wintypes.LPARAM]
+# Window lookup signatures
+user32.FindWindowExW.restype  = wintypes.HWND
+user32.FindWindowExW.argtypes = [wintypes.HWND, wintypes.HWND, wintypes.LPCWSTR, wintypes.LPCWSTR]
+user32.IsWindowVisible.restype  = wintypes.BOOL
 user32.IsWindowVisible.argtypes = [wintypes.HWND]
-user32.GetWindowTextLengthW.argtypes = [wintypes.HWND]
-user32.GetWindowTextW.argtypes = [wintypes.HWND, wintypes.LPWSTR, ctypes.c_int]
+user32.GetWindowThreadProcessId.restype  = wintypes.DWORD
+user32.GetWindowThreadProcessId.argtypes = [wintypes.HWND, ctypes.POINTER(wintypes.DWORD)]
 user32.PostMessageW.argtypes   = [wintypes.HWND, wintypes.UINT, wintypes.WPARAM, wintypes.LPARAM]
 
-def _enum_windows_titles():
-    titles = []
-    @WNDENUMPROC
-    def _cb(hwnd, lparam):
-        try:
-            if not user32.IsWindowVisible(hwnd):
-                return True
-            length = user32.GetWindowTextLengthW(hwnd)
-            if length:
-                buf = ctypes.create_unicode_buffer(length + 1)
-                user32.GetWindowTextW(hwnd, buf, length + 1)
-                titles.append((hwnd, buf.value))
-        except Exception:
-            pass
-        return True
-    user32.EnumWindows(_cb, 0)
-    return titles
+# Process wait signatures
+kernel32.OpenProcess.restype  = wintypes.HANDLE
+kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+kernel32.WaitForSingleObject.restype  = wintypes.DWORD
+kernel32.WaitForSingleObject.argtypes = [wintypes.HANDLE, wintypes.DWORD]
+kernel32.CloseHandle.restype  = wintypes.BOOL
+kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+
+def _find_windows_by_title(title: str):
+    """All visible top-level windows titled `title` (one per running instance)."""
+    hwnds = []
+    hwnd = user32.FindWindowExW(None, None, None, title)
+    while hwnd:
+        if user32.IsWindowVisible(hwnd):
+            hwnds.append(hwnd)
+        hwnd = user32.FindWindowExW(None, hwnd, None, title)
+    return hwnds
+
+def _open_owner_process(hwnd):
+    pid = wintypes.DWORD()
+    user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+    return kernel32.OpenProcess(SYNCHRONIZE, False, pid.value) if pid.value else None
 
 def close_existing_instance_by_title(title: str, wait_ms: int = 2000) -> bool:
     """If a window titled `title` exists, send WM_CLOSE and wait briefly."""
-    found = False
-    for hwnd, text in _enum_windows_titles():
-        if text == title:
-            user32.PostMessageW(hwnd, WM_CLOSE, 0, 0)
-            found = True
-    if not found:
+    # Track the matched handles; the wait never re-runs the lookup
+    hwnds = _find_windows_by_title(title)
+    if not hwnds:
         return False
-    end = time.time() + (wait_ms / 1000.0)
-    while time.time() < end:
-        still_there = any(text == title for _, text in _enum_windows_titles())
-        if not still_there:
-            break
-        time.sleep(0.05)
+    proc = _open_owner_process(hwnds[0])
+    for hwnd in hwnds:
+        user32.PostMessageW(hwnd, WM_CLOSE, 0, 0)
+    try:
+        # Sticky.closeEvent only hides the window, so this is in practice a
+        # 50 ms visibility poll; blocking on the owner's process handle (when
+        # it could be opened) only ends a slice early if the owner does exit.
+        deadline = time.perf_counter() + (wait_ms / 1000.0)
+        while hwnds and (remaining := deadline - time.perf_counter()) > 0:
+            slice_ms = min(50, int(remaining * 1000) + 1)
+            if proc:
+                if kernel32.WaitForSingleObject(proc, slice_ms) != WAIT_TIMEOUT:
+                    # Owner exited or the wait failed; stop waiting on the handle
+                    kernel32.CloseHandle(proc)
+                    proc = None
+            else:
+                time.sleep(slice_ms / 1000.0)
+            hwnds = [hwnd for hwnd in hwnds if user32.IsWindowVisible(hwnd)]
+    finally:
+        if proc:
+            kernel32.CloseHandle(proc)
     return True
 
 # ---- State helpers ----
@@ -135,19 +165,63 @@ THEMES = {
     "amber": {"bg": (80, 50, 20, 200), "text": "white", "border": (255, 200, 100, 160)},
 }
 
+# In-memory copy of state.json; disk is only touched on first load and on flush
+_STATE_CACHE = None
+_STATE_DIRTY = False
+SAVE_DEBOUNCE_MS = 300
+
+def _precompute_themes():
+    """Build the Qt paint objects and label stylesheet for every theme once."""
+    objects = {}
+    for name, theme in THEMES.items():
+        border = QtGui.QColor(*theme["border"])
+        pen_1 = QtGui.QPen(border)
+        pen_1.setWidth(1)
+        pen_2 = QtGui.QPen(border)
+        pen_2.setWidth(2)
+        objects[name] = {
+            "bg_brush": QtGui.QBrush(QtGui.QColor(*theme["bg"])),
+            "pen_1": pen_1,
+            "pen_2": pen_2,
+            "label_qss": f"color: {theme['text']};",
+        }
+    return objects
+
+THEME_OBJECTS = _precompute_themes()
+
 def load_state():
+    global _STATE_CACHE
+    if _STATE_CACHE is not None:
+        return _STATE_CACHE
     try:
-        return { **DEFAULT_STATE, **json.loads(STATE_PATH.read_text(encoding="utf-8")) }
+        _STATE_CACHE = { **DEFAULT_STATE, **_loads(STATE_PATH.read_bytes()) }
     except Exception:
-        return DEFAULT_STATE.copy()
+        _STATE_CACHE = DEFAULT_STATE.copy()
+    return _STATE_CACHE
 
 def save_state(d):
+    """Update the cached state; the actual write happens in flush_state()."""
+    global _STATE_CACHE, _STATE_DIRTY
+    _STATE_CACHE = d
+    _STATE_DIRTY = True
+
+def flush_state():
+    """Write the cached state to disk if it changed (atomic replace)."""
+    global _STATE_DIRTY
+    if not _STATE_DIRTY or _STATE_CACHE is None:
+        return
+    tmp = STATE_PATH.with_suffix(".tmp")
     try:
-        STATE_PATH.write_text(json.dumps(d, indent=2), encoding="utf-8")
+        tmp.write_bytes(_dumps(_STATE_CACHE))
+        os.replace(tmp, STATE_PATH)
+        _STATE_DIRTY = False
     except Exception:
         pass
 
 def delete_state():
+    global _STATE_CACHE, _STATE_DIRTY
+    _STATE_CACHE = None
+    _STATE_DIRTY = False
     try:
         if STATE_PATH.exists():
             STATE_PATH.unlink()
@@ -155,22 +229,26 @@ def delete_state():
         pass
 
 # ---- Native event filter for global hotkeys ----
+# Every native message passes through the filter, so only read the message id
+# and build the full MSG struct for WM_HOTKEY.
+_MSG_MESSAGE_OFFSET = wt.MSG.message.offset
+_UINT = ctypes.c_uint
+
 class HotkeyFilter(QtCore.QAbstractNativeEventFilter):
     def __init__(self, handler):
         super().__init__()
         self.handler = handler
     def nativeEventFilter(self, eventType, message):
         if eventType == "windows_generic_MSG":
-            try:
-                addr = int(message) if isinstance(message, int) else int(message.__int__())
-                msg = ctypes.cast(addr, ctypes.POINTER(wt.MSG)).contents
-                if msg.message == WM_HOTKEY:
-                    self.handler(msg.wParam)
-            except KeyboardInterrupt:
-                # Ignore Ctrl+C in console without spamming errors
-                return False, 0
-            except Exception:
-                return False, 0
+            addr = int(message)
+            if _UINT.from_address(addr + _MSG_MESSAGE_OFFSET).value == WM_HOTKEY:
+                try:
+                    self.handler(wt.MSG.from_address(addr).wParam)
+                except KeyboardInterrupt:
+                    # Ignore Ctrl+C in console without spamming errors
+                    return False, 0
+                except Exception:
+                    return False, 0
         return False, 0
 
 # ---- Settings Dialog ----
@@ -259,7 +337,61 @@ class SettingsDialog(QtWidgets.QDialog):
             "auto_hide_timer": self.auto_hide.value()
         }
 
+# ---- Tray icon ----
+# Built lazily (needs a QApplication) and shared across Sticky instances
+_TRAY_ICON = None
+
+def _build_tray_icon():
+    pixmap = QtGui.QPixmap(16, 16)
+    pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+    painter = QtGui.QPainter(pixmap)
+    painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
+    painter.setBrush(QtGui.QBrush(QtGui.QColor(255, 255, 100)))
+    painter.setPen(QtGui.QPen(QtGui.QColor(200, 200, 50), 1))
+    painter.drawRoundedRect(2, 2, 12, 12, 2, 2)
+    painter.setPen(QtGui.QPen(QtGui.QColor(150, 150, 50), 1))
+    painter.drawLine(4, 6, 12, 6)
+    painter.drawLine(4, 9, 11, 9)
+    painter.drawLine(4, 12, 10, 12)
+    painter.end()
+    return QtGui.QIcon(pixmap)
+
+# ---- Font / stylesheet caches ----
+_FONT_CACHE: dict[tuple, QtGui.QFont] = {}
+_QSS_CACHE: dict[tuple, str] = {}
+
+def _font(family, point_size):
+    key = (family, point_size)
+    font = _FONT_CACHE.get(key)
+    if font is None:
+        font = QtGui.QFont(family)
+        font.setPointSizeF(point_size)
+        font.setBold(True)
+        _FONT_CACHE[key] = font
+    return font
+
+def _editor_qss(theme_name, radius):
+    key = ("editor", theme_name, radius)
+    qss = _QSS_CACHE.get(key)
+    if qss is None:
+        theme = THEMES[theme_name]
+        bg_color = theme["bg"]
+        editor_bg = f"rgba({bg_color[0]}, {bg_color[1]}, {bg_color[2]}, {min(255, int(bg_color[3] * 1.3))})"
+        qss = _QSS_CACHE[key] = f"""
+            QTextEdit {{
+                background-color: {editor_bg};
+                color: {theme['text']};
+                border: 2px solid rgba({theme['border'][0]}, {theme['border'][1]}, {theme['border'][2]}, {theme['border'][3]});
+                border-radius: {radius}px;
+                padding: 8px;
+            }}
+        """
+    return qss
+
 # ---- Sticky window ----
+# Max rendered backgrounds kept per Sticky (keyed by size/theme/edit mode)
+BG_CACHE_SIZE = 8
+
 class Sticky(QtWidgets.QWidget):
     def __init__(self, start_fresh: bool = False):
         super().__init__(None, QtCore.Qt.WindowType.FramelessWindowHint | QtCore.Qt.WindowType.Tool)
@@ -272,12 +404,29 @@ class Sticky(QtWidgets.QWidget):
         self._opacity = float(self.state["opacity"])
         self._radius = 12
         self._is_editing = False
-
-        # Auto-hide timer
-        self.auto_hide_timer = QtCore.QTimer()
-        self.auto_hide_timer.setSingleShot(True)
-        self.auto_hide_timer.timeout.connect(self.hide)
-        self._reset_auto_hide_timer()
+        self._bg_cache: OrderedDict[tuple, QtGui.QPixmap] = OrderedDict()
+
+        # Coalesce bursts of state changes (drag, hotkey repeat) into one write
+        self._save_timer = QtCore.QTimer(self)
+        self._save_timer.setSingleShot(True)
+        self._save_timer.timeout.connect(flush_state)
+
+        # Auto-hide: one coarse repeating timer checks idle time, so activity
+        # only records a timestamp instead of restarting a timer
+        self._last_activity = time.monotonic()
+        self.auto_hide_timer = QtCore.QTimer(self)
+        self.auto_hide_timer.setInterval(60000)
+        self.auto_hide_timer.timeout.connect(self._check_auto_hide)
+        self._update_auto_hide_timer()
+
+        # Screen geometry cache, refreshed when monitors change
+        self._screen_rects: list[tuple[QtGui.QScreen, QtCore.QRect, QtCore.QRect]] = []
+        app = QtGui.QGuiApplication.instance()
+        app.screenAdded.connect(self._on_screen_added)
+        app.screenRemoved.connect(self._refresh_screens)
+        for screen in QtGui.QGuiApplication.screens():
+            self._watch_screen(screen)
+        self._refresh_screens()
 
         # UI
         self._setup_ui()
@@ -312,15 +461,36 @@ class Sticky(QtWidgets.QWidget):
             x, y = ar.left() + 80, ar.top() + 80
             w, h = 350, 120
             self.state.update({"x": x, "y": y, "w": w, "h": h})
-            save_state(self.state)
+            self._schedule_save()
         self.setGeometry(x, y, w, h)
 
     def _rect_on_any_screen(self, rect: QtCore.QRect) -> bool:
-        for s in QtGui.QGuiApplication.screens():
-            if s.availableGeometry().intersects(rect):
+        for _, _, available in self._screen_rects:
+            if available.intersects(rect):
                 return True
         return False
 
+    def _refresh_screens(self, *_):
+        self._screen_rects = [
+            (s, s.geometry(), s.availableGeometry()) for s in QtGui.QGuiApplication.screens()
+        ]
+
+    def _watch_screen(self, screen):
+        screen.geometryChanged.connect(self._refresh_screens)
+        screen.availableGeometryChanged.connect(self._refresh_screens)
+        screen.logicalDotsPerInchChanged.connect(self._refresh_screens)
+
+    def _on_screen_added(self, screen):
+        self._watch_screen(screen)
+        self._refresh_screens()
+
+    def _screen_rect_at(self, p: QtCore.QPoint):
+        """Available geometry of the screen containing `p`, or None."""
+        for _, geometry, available in self._screen_rects:
+            if geometry.contains(p):
+                return available
+        return None
+
     # ---- paint & input ----
     def _setup_ui(self):
         self.label = QtWidgets.QLabel(self.state["text"])
@@ -341,54 +511,66 @@ class Sticky(QtWidgets.QWidget):
         self.layout.addWidget(self.editor)
 
     def _update_label_style(self):
-        theme = THEMES[self.state["theme"]]
-        font = QtGui.QFont(self.state["font_family"])
-        font.setPointSizeF(self.state["font_pt"])
-        font.setBold(True)
-        self.label.setFont(font)
-        self.label.setStyleSheet(f"color: {theme['text']};")
+        self.label.setFont(_font(self.state["font_family"], self.state["font_pt"]))
+        qss = THEME_OBJECTS[self.state["theme"]]["label_qss"]
+        if qss != self.label.styleSheet():
+            self.label.setStyleSheet(qss)
         self.label.setWordWrap(self.state["word_wrap"])
 
     def _update_editor_style(self):
-        theme = THEMES[self.state["theme"]]
-        bg_color = theme["bg"]
-        editor_bg = f"rgba({bg_color[0]}, {bg_color[1]}, {bg_color[2]}, {min(255, int(bg_color[3] * 1.3))})"
-        font = QtGui.QFont(self.state["font_family"])
-        font.setPointSizeF(self.state["font_pt"])
-        font.setBold(True)
-        self.editor.setFont(font)
-        self.editor.setStyleSheet(f"""
-            QTextEdit {{
-                background-color: {editor_bg};
-                color: {theme['text']};
-                border: 2px solid rgba({theme['border'][0]}, {theme['border'][1]}, {theme['border'][2]}, {theme['border'][3]});
-                border-radius: {self._radius}px;
-                padding: 8px;
-            }}
-        """)
+        self.editor.setFont(_font(self.state["font_family"], self.state["font_pt"]))
+        qss = _editor_qss(self.state["theme"], self._radius)
+        if qss != self.editor.styleSheet():
+            self.editor.setStyleSheet(qss)
 
     def _reset_auto_hide_timer(self):
+        self._last_activity = time.monotonic()
+
+    def _update_auto_hide_timer(self):
         if self.state["auto_hide_timer"] > 0:
-            self.auto_hide_timer.start(self.state["auto_hide_timer"] * 60000)
+            if not self.auto_hide_timer.isActive():
+                self.auto_hide_timer.start()
+        else:
+            self.auto_hide_timer.stop()
+
+    def _check_auto_hide(self):
+        minutes = self.state["auto_hide_timer"]
+        if minutes > 0 and time.monotonic() - self._last_activity >= minutes * 60:
+            self.hide()
 
     def paintEvent(self, ev):
+        dpr = self.devicePixelRatioF()
+        key = (self.width(), self.height(), dpr, self.state["theme"], self._is_editing)
+        pixmap = self._bg_cache.get(key)
+        if pixmap is None:
+            pixmap = QtGui.QPixmap(self.size() * dpr)
+            pixmap.setDevicePixelRatio(dpr)
+            pixmap.fill(QtCore.Qt.GlobalColor.transparent)
+            self._paint_background(pixmap)
+            self._bg_cache[key] = pixmap
+            if len(self._bg_cache) > BG_CACHE_SIZE:
+                self._bg_cache.popitem(last=False)
+        else:
+            self._bg_cache.move_to_end(key)
         painter = QtGui.QPainter(self)
+        painter.drawPixmap(0, 0, pixmap)
+
+    def _paint_background(self, device):
+        painter = QtGui.QPainter(device)
         painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing, True)
         rect = self.rect().adjusted(0, 0, -1, -1)
-        theme = THEMES[self.state["theme"]]
-        bg = QtGui.QColor(*theme["bg"])
-        pen = QtGui.QPen(QtGui.QColor(*theme["border"]))
-        pen.setWidth(2 if self._is_editing else 1)
+        t = THEME_OBJECTS[self.state["theme"]]
         path = QtGui.QPainterPath()
         path.addRoundedRect(rect, self._radius, self._radius)
-        painter.fillPath(path, bg)
-        painter.setPen(pen)
+        painter.fillPath(path, t["bg_brush"])
+        painter.setPen(t["pen_2" if self._is_editing else "pen_1"])
         painter.drawPath(path)
         if not self._is_editing:
             gradient = QtGui.QLinearGradient(0, 0, 0, rect.height())
             gradient.setColorAt(0, QtGui.QColor(255, 255, 255, 30))
             gradient.setColorAt(1, QtGui.QColor(0, 0, 0, 20))
             painter.fillPath(path, gradient)
+        painter.end()
 
     def mousePressEvent(self, ev):
         if ev.button() == QtCore.Qt.MouseButton.LeftButton and not self._click_through:
@@ -402,9 +584,8 @@ class Sticky(QtWidgets.QWidget):
         if self._drag_origin:
             delta = ev.globalPosition().toPoint() - self._drag_origin[0]
             new_pos = self._drag_origin[1] + delta
-            screen = QtGui.QGuiApplication.screenAt(new_pos)
-            if screen:
-                sr = screen.availableGeometry()
+            sr = self._screen_rect_at(new_pos)
+            if sr:
                 wr = QtCore.QRect(new_pos, self.size())
                 if wr.right() > sr.right():  new_pos.setX(sr.right() - self.width())
                 if wr.bottom() > sr.bottom(): new_pos.setY(sr.bottom() - self.height())
@@ -484,6 +665,7 @@ class Sticky(QtWidgets.QWidget):
         self.setWindowOpacity(self._opacity)
         self._update_label_style()
         self._update_editor_style()
+        self._update_auto_hide_timer()
         self._reset_auto_hide_timer()
         self.update()
 
@@ -561,9 +743,8 @@ class Sticky(QtWidgets.QWidget):
     def move_window(self, dx, dy):
         current = self.geometry()
         new_pos = QtCore.QPoint(current.x() + dx, current.y() + dy)
-        screen = QtGui.QGuiApplication.screenAt(new_pos)
-        if screen:
-            sr = screen.availableGeometry()
+        sr = self._screen_rect_at(new_pos)
+        if sr:
             new_pos.setX(max(sr.left(), min(sr.right() - current.width(), new_pos.x())))
             new_pos.setY(max(sr.top(),  min(sr.bottom() - current.height(), new_pos.y())))
         self.move(new_pos)
@@ -571,19 +752,19 @@ class Sticky(QtWidgets.QWidget):
 
     def _apply_click_through(self):
         hwnd = int(self.winId())
-        ex_style = GetWindowLongPtrW(hwnd, GWL_EXSTYLE)
-        ex_style |= WS_EX_LAYERED | WS_EX_TOOLWINDOW
+        cur = GetWindowLongPtrW(hwnd, GWL_EXSTYLE)
+        ex_style = cur | WS_EX_LAYERED | WS_EX_TOOLWINDOW
         if self._click_through:
             ex_style |= WS_EX_TRANSPARENT | WS_EX_NOACTIVATE
         else:
             ex_style &= ~(WS_EX_TRANSPARENT | WS_EX_NOACTIVATE)
-        SetWindowLongPtrW(hwnd, GWL_EXSTYLE, ex_style)
+        if ex_style != cur:
+            SetWindowLongPtrW(hwnd, GWL_EXSTYLE, ex_style)
 
     def _apply_on_screen(self):
-        screen = QtGui.QGuiApplication.screenAt(self.pos())
-        if not screen:
+        sr = self._screen_rect_at(self.pos())
+        if not sr:
             return
-        sr = screen.availableGeometry()
         r = self.geometry()
         nx = min(max(sr.left(), r.x()), sr.right() - r.width())
         ny = min(max(sr.top(),  r.y()), sr.bottom() - r.height())
@@ -610,7 +791,7 @@ class Sticky(QtWidgets.QWidget):
             "x": rect.x(), "y": rect.y(),
             "w": rect.width(), "h": rect.height()
         })
-        save_state(self.state)
+        self._schedule_save()
 
     def _save_state(self):
         rect = self.geometry()
@@ -622,23 +803,18 @@ class Sticky(QtWidgets.QWidget):
             "opacity": self._opacity,
             "font_pt": self.state["font_pt"]
         })
+        self._schedule_save()
+
+    def _schedule_save(self):
         save_state(self.state)
+        self._save_timer.start(SAVE_DEBOUNCE_MS)
 
     def _create_tray_icon(self):
+        global _TRAY_ICON
         tray = QtWidgets.QSystemTrayIcon(self)
-        pixmap = QtGui.QPixmap(16, 16)
-        pixmap.fill(QtCore.Qt.GlobalColor.transparent)
-        painter = QtGui.QPainter(pixmap)
-        painter.setRenderHint(QtGui.QPainter.RenderHint.Antialiasing)
-        painter.setBrush(QtGui.QBrush(QtGui.QColor(255, 255, 100)))
-        painter.setPen(QtGui.QPen(QtGui.QColor(200, 200, 50), 1))
-        painter.drawRoundedRect(2, 2, 12, 12, 2, 2)
-        painter.setPen(QtGui.QPen(QtGui.QColor(150, 150, 50), 1))
-        painter.drawLine(4, 6, 12, 6)
-        painter.drawLine(4, 9, 11, 9)
-        painter.drawLine(4, 12, 10, 12)
-        painter.end()
-        tray.setIcon(QtGui.QIcon(pixmap))
+        if _TRAY_ICON is None:
+            _TRAY_ICON = _build_tray_icon()
+        tray.setIcon(_TRAY_ICON)
         menu = QtWidgets.QMenu()
         act_show = menu.addAction("👁️ Show/Hide")
         act_edit = menu.addAction("✏️ Edit")
@@ -717,22 +893,29 @@ def main():
     hwnd = int(sticky.winId())
     register_hotkeys(hwnd)
 
+    handlers = {
+        HK_EDIT:         sticky.begin_edit,
+        HK_CLICK:        sticky.toggle_click_through,
+        HK_LEFT:         lambda: sticky.move_window(-10, 0),
+        HK_RIGHT:        lambda: sticky.move_window(10, 0),
+        HK_UP:           lambda: sticky.move_window(0, -10),
+        HK_DOWN:         lambda: sticky.move_window(0, 10),
+        HK_MINIMIZE:     sticky._toggle_visibility,
+        HK_OPACITY_UP:   lambda: sticky.adjust_opacity(0.1),
+        HK_OPACITY_DOWN: lambda: sticky.adjust_opacity(-0.1),
+    }
+
     def on_hotkey(wparam):
-        if wparam == HK_EDIT:           sticky.begin_edit()
-        elif wparam == HK_CLICK:        sticky.toggle_click_through()
-        elif wparam == HK_LEFT:         sticky.move_window(-10, 0)
-        elif wparam == HK_RIGHT:        sticky.move_window(10, 0)
-        elif wparam == HK_UP:           sticky.move_window(0, -10)
-        elif wparam == HK_DOWN:         sticky.move_window(0, 10)
-        elif wparam == HK_MINIMIZE:     sticky._toggle_visibility()
-        elif wparam == HK_OPACITY_UP:   sticky.adjust_opacity(0.1)
-        elif wparam == HK_OPACITY_DOWN: sticky.adjust_opacity(-0.1)
+        handler = handlers.get(wparam)
+        if handler:
+            handler()
 
     hotkey_filter = HotkeyFilter(on_hotkey)
     app.installNativeEventFilter(hotkey_filter)
 
     def cleanup():
         unregister_hotkeys(hwnd)
+        flush_state()
 
     app.aboutToQuit.connect(cleanup)
 